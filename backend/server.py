@@ -1,17 +1,26 @@
-from fastapi import FastAPI, APIRouter, Depends, HTTPException, status, Body
+from fastapi import FastAPI, APIRouter, Depends, HTTPException, status, Body, Query
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError, OperationFailure
 import os
 import logging
 from pathlib import Path
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, Field, EmailStr, field_validator
 from typing import List, Optional, Dict, Union, Any
 import uuid
-from datetime import datetime, timedelta
-import jwt
-from passlib.context import CryptContext
+import re
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import time
+from datetime import datetime, timedelta, timezone
+from jose import jwt, JWTError
+from cachetools import TTLCache
+import bcrypt
 from bson import ObjectId
 from enum import Enum
 
@@ -20,24 +29,49 @@ load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+# Larger, pre-warmed pool for routes issuing several queries each, plus wire compression
+# (zstd preferred, zlib as a fallback for servers without it)
+client = AsyncIOMotorClient(
+    mongo_url,
+    maxPoolSize=200,
+    minPoolSize=20,
+    compressors="zstd,zlib",
+    zlibCompressionLevel=-1,
+    retryWrites=True,
+    serverSelectionTimeoutMS=2000
+)
 db = client[os.environ['DB_NAME']]
 
-# Create the main app without a prefix
-app = FastAPI()
+# Create the main app without a prefix; orjson serializes every response
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
 # JWT Settings
-SECRET_KEY = os.environ.get("SECRET_KEY", "defaultsecretkey")
+# Kept as bytes so the signing key is not re-encoded on every encode/decode
+SECRET_KEY = os.environ.get("SECRET_KEY", "defaultsecretkey").encode()
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# Pagination settings for list endpoints
+MAX_PAGE_SIZE = 1000
+CURSOR_BATCH_SIZE = 200
+
 # Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+BCRYPT_ROUNDS = 12
+BCRYPT_PREFIX = b"2b"
+BCRYPT_MAX_PASSWORD_BYTES = 72  # bcrypt rejects longer inputs
+# bcrypt releases the GIL, so a thread pool sized to the CPU count parallelizes hashing
+# without the pickling overhead of a process pool
+password_executor = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="bcrypt")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/token")
 
+# Cache of validated tokens -> (username, exp) so repeat requests skip JWT decoding. The user
+# itself is always re-read so contribution stats and role changes are never served stale
+TOKEN_CACHE_TTL_SECONDS = 60
+token_cache = TTLCache(maxsize=10000, ttl=TOKEN_CACHE_TTL_SECONDS)
+
 # User role enum
 class UserRole(str, Enum):
     USER = "user"
@@ -50,18 +84,25 @@ class User(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     email: EmailStr
     username: str
-    hashed_password: str
+    hashed_password: bytes  # Stored as BinData; legacy string hashes are coerced on load
     role: UserRole = UserRole.USER
     contributor_rank: int = 0  # Starting rank for contributors
     contribution_count: int = 0
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class UserCreate(BaseModel):
     email: EmailStr
     username: str
     password: str
 
+    @field_validator("password")
+    @classmethod
+    def password_fits_bcrypt(cls, value: str) -> str:
+        if len(value.encode()) > BCRYPT_MAX_PASSWORD_BYTES:
+            raise ValueError(f"Password must be at most {BCRYPT_MAX_PASSWORD_BYTES} bytes")
+        return value
+
 class UserResponse(BaseModel):
     id: str
     email: EmailStr
@@ -86,8 +127,8 @@ class Language(BaseModel):
     name: str
     code: str  # ISO 639-1 two-letter language code
     native_name: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class Word(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -96,8 +137,8 @@ class Word(BaseModel):
     meanings: List[Dict[str, str]] = []  # [{"language_id": "...", "meaning": "..."}]
     created_by: str  # User ID
     last_modified_by: str  # User ID
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class WordCreate(BaseModel):
     word: str
@@ -110,17 +151,37 @@ class Contribution(BaseModel):
     word_id: str
     contribution_type: str  # "add", "edit", "translation"
     change_details: Dict[str, Any] = {}
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 # Helper functions
-def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+# bcrypt is CPU-bound, so run it off the event loop to keep other requests responsive
+async def verify_password(plain_password, hashed_password):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        password_executor, bcrypt.checkpw, plain_password.encode(), hashed_password
+    )
 
-def get_password_hash(password):
-    return pwd_context.hash(password)
+async def get_password_hash(password):
+    loop = asyncio.get_running_loop()
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS, prefix=BCRYPT_PREFIX)
+    return await loop.run_in_executor(password_executor, bcrypt.hashpw, password.encode(), salt)
+
+# Fields needed to build a UserInDB; everything else stays on the server
+USER_PROJECTION = {
+    "_id": 0,
+    "id": 1,
+    "username": 1,
+    "email": 1,
+    "role": 1,
+    "hashed_password": 1,
+    "contributor_rank": 1,
+    "contribution_count": 1,
+    "created_at": 1,
+    "updated_at": 1
+}
 
 async def get_user(username: str):
-    user = await db.users.find_one({"username": username})
+    user = await db.users.find_one({"username": username}, USER_PROJECTION)
     if user:
         return UserInDB(**user)
 
@@ -128,16 +189,37 @@ async def authenticate_user(username: str, password: str):
     user = await get_user(username)
     if not user:
         return False
-    if not verify_password(password, user.hashed_password):
+    # No stored hash can match a password bcrypt would refuse to hash
+    if len(password.encode()) > BCRYPT_MAX_PASSWORD_BYTES:
+        return False
+    if not await verify_password(password, user.hashed_password):
         return False
     return user
 
+async def record_contribution(user: User, contribution: Contribution):
+    # Simple ranking algorithm - can be made more sophisticated. The rank is derived
+    # server-side from the incremented count (one rank per started block of ten), so
+    # concurrent contributions cannot act on a stale count
+    new_count = {"$add": ["$contribution_count", 1]}
+    stats_update = [
+        {"$set": {
+            "contribution_count": new_count,
+            "contributor_rank": {"$toInt": {"$ceil": {"$divide": [new_count, 10]}}}
+        }}
+    ]
+    
+    # The contribution record and the user stats update are independent, so issue them concurrently
+    await asyncio.gather(
+        db.contributions.insert_one(contribution.model_dump()),
+        db.users.update_one({"id": user.id}, stats_update),
+    )
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = datetime.now(timezone.utc) + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=15)
+        expire = datetime.now(timezone.utc) + timedelta(minutes=15)
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
@@ -148,63 +230,89 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = token_cache.get(cache_key)
+    # Entries never outlive the token itself
+    if cached and time.time() < cached[1]:
+        token_data = TokenData(username=cached[0])
+    else:
+        token_cache.pop(cache_key, None)
+        try:
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+            username: str = payload.get("sub")
+            if username is None:
+                raise credentials_exception
+            token_data = TokenData(username=username)
+        except JWTError:
             raise credentials_exception
-        token_data = TokenData(username=username)
-    except jwt.PyJWTError:
-        raise credentials_exception
+        # Only valid tokens reach this point; bound the cached lifetime by the token's exp claim
+        token_cache[cache_key] = (username, min(time.time() + TOKEN_CACHE_TTL_SECONDS, payload["exp"]))
     user = await get_user(username=token_data.username)
     if user is None:
         raise credentials_exception
     return user
 
-async def get_current_active_user(current_user: User = Depends(get_current_user)):
-    return current_user
-
-async def is_moderator(current_user: User = Depends(get_current_user)):
-    if current_user.role not in [UserRole.MODERATOR, UserRole.ADMIN]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Insufficient permissions"
-        )
-    return current_user
+def require_role(*roles: UserRole):
+    # Single dependency that resolves the current user and checks their role in one step
+    async def role_dependency(current_user: User = Depends(get_current_user)):
+        if current_user.role not in roles:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Insufficient permissions"
+            )
+        return current_user
+    return role_dependency
 
 # Routes for Authentication
 @api_router.post("/register", response_model=UserResponse)
 async def register_user(user_data: UserCreate):
-    # Check if username already exists
-    existing_user = await db.users.find_one({"username": user_data.username})
+    # Cheap single-query probe so duplicates are rejected before paying for a bcrypt hash;
+    # the unique indexes below still catch registrations that race past it
+    existing_user = await db.users.find_one(
+        {"$or": [{"username": user_data.username}, {"email": user_data.email}]},
+        {"_id": 0, "username": 1, "email": 1}
+    )
     if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Username already registered"
-        )
-    
-    # Check if email already exists
-    existing_email = await db.users.find_one({"email": user_data.email})
-    if existing_email:
+        if existing_user.get("username") == user_data.username:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Username already registered"
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
     
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await get_password_hash(user_data.password)
+    now = datetime.now(timezone.utc)
     user_in_db = User(
+        id=str(uuid.uuid4()),
         email=user_data.email,
         username=user_data.username,
         hashed_password=hashed_password,
-        role=UserRole.CONTRIBUTOR  # Start as contributor
+        role=UserRole.CONTRIBUTOR,  # Start as contributor
+        created_at=now,
+        updated_at=now
     )
     
-    # Insert into database
-    await db.users.insert_one(user_in_db.dict())
+    # Insert into database; the unique indexes on username/email reject duplicates atomically
+    user_dict = user_in_db.model_dump()
+    try:
+        await db.users.insert_one(user_dict)
+    except DuplicateKeyError as e:
+        key_pattern = (e.details or {}).get("keyPattern", {})
+        if "email" in key_pattern:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already registered"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Username already registered"
+        )
     
     # Return user without password
-    user_dict = user_in_db.dict()
     return UserResponse(**user_dict)
 
 @api_router.post("/token", response_model=Token)
@@ -223,99 +331,108 @@ async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(
     return {"access_token": access_token, "token_type": "bearer"}
 
 @api_router.get("/users/me", response_model=UserResponse)
-async def read_users_me(current_user: User = Depends(get_current_active_user)):
+async def read_users_me(current_user: User = Depends(get_current_user)):
     return current_user
 
 # Language routes
-@api_router.get("/languages", response_model=List[Language])
-async def get_languages():
-    languages = await db.languages.find().to_list(1000)
-    return [Language(**language) for language in languages]
+# Read-only routes return stored documents as-is, skipping Pydantic response validation
+@api_router.get("/languages")
+async def get_languages(skip: int = Query(0, ge=0), limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)):
+    cursor = (
+        db.languages.find({}, {"_id": 0})
+        .sort("_id", 1)  # Insertion order, so seeded languages keep their original order
+        .skip(skip)
+        .limit(limit)
+        .batch_size(CURSOR_BATCH_SIZE)
+    )
+    return [language async for language in cursor]
 
 @api_router.post("/languages", response_model=Language)
-async def create_language(language: Language, current_user: User = Depends(get_current_active_user)):
+async def create_language(
+    language: Language,
+    current_user: User = Depends(get_current_user)
+):
     # Allow both contributors and moderators to add languages
-    language_dict = language.dict()
+    now = datetime.now(timezone.utc)
+    language.created_at = now
+    language.updated_at = now
+    language_dict = language.model_dump()
     await db.languages.insert_one(language_dict)
     
     # Record this as a contribution
     contribution = Contribution(
+        id=str(uuid.uuid4()),
         user_id=current_user.id,
         word_id="", # Not applicable for language addition
         contribution_type="add_language",
-        change_details={"language_name": language.name, "language_code": language.code}
-    )
-    await db.contributions.insert_one(contribution.dict())
-    
-    # Update user contribution count and rank
-    await db.users.update_one(
-        {"id": current_user.id},
-        {"$inc": {"contribution_count": 1}}
+        change_details={"language_name": language.name, "language_code": language.code},
+        created_at=now
     )
-    
-    # Simple ranking algorithm - can be made more sophisticated
-    if current_user.contribution_count % 10 == 0:
-        await db.users.update_one(
-            {"id": current_user.id},
-            {"$inc": {"contributor_rank": 1}}
-        )
+    await record_contribution(current_user, contribution)
     
     return language
 
 # Word and translation routes
-@api_router.get("/words", response_model=List[Word])
-async def get_words(language_id: Optional[str] = None, search: Optional[str] = None):
+@api_router.get("/words")
+async def get_words(
+    language_id: Optional[str] = None,
+    search: Optional[str] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+):
     query = {}
+    # Pages need a deterministic order; _id is unique, indexed and in insertion order
+    sort = [("_id", 1)]
     if language_id:
         query["language_id"] = language_id
     if search:
-        query["word"] = {"$regex": search, "$options": "i"}  # Case-insensitive search
+        query["$text"] = {"$search": search}  # Served by the text index on word
+        sort = [("score", {"$meta": "textScore"}), ("_id", 1)]
     
-    words = await db.words.find(query).to_list(1000)
-    return [Word(**word) for word in words]
+    cursor = (
+        db.words.find(query, {"_id": 0})
+        .sort(sort)
+        .skip(skip)
+        .limit(limit)
+        .batch_size(CURSOR_BATCH_SIZE)
+    )
+    return [word async for word in cursor]
 
-@api_router.get("/words/{word_id}", response_model=Word)
+@api_router.get("/words/{word_id}")
 async def get_word(word_id: str):
-    word = await db.words.find_one({"id": word_id})
+    word = await db.words.find_one({"id": word_id}, {"_id": 0})
     if not word:
         raise HTTPException(status_code=404, detail="Word not found")
-    return Word(**word)
+    return word
 
 @api_router.post("/words", response_model=Word)
-async def create_word(word_data: WordCreate, current_user: User = Depends(get_current_active_user)):
-    # Create new word
+async def create_word(word_data: WordCreate, current_user: User = Depends(get_current_user)):
+    # Create new word, sharing one timestamp across the word and its contribution record
+    now = datetime.now(timezone.utc)
     new_word = Word(
+        id=str(uuid.uuid4()),
         word=word_data.word,
         language_id=word_data.language_id,
         meanings=word_data.meanings,
         created_by=current_user.id,
-        last_modified_by=current_user.id
+        last_modified_by=current_user.id,
+        created_at=now,
+        updated_at=now
     )
     
     # Insert into database
-    await db.words.insert_one(new_word.dict())
+    await db.words.insert_one(new_word.model_dump())
     
     # Record contribution
     contribution = Contribution(
+        id=str(uuid.uuid4()),
         user_id=current_user.id,
         word_id=new_word.id,
         contribution_type="add",
-        change_details={"word": word_data.word}
+        change_details={"word": word_data.word},
+        created_at=now
     )
-    await db.contributions.insert_one(contribution.dict())
-    
-    # Update user contribution count and rank
-    await db.users.update_one(
-        {"id": current_user.id},
-        {"$inc": {"contribution_count": 1}}
-    )
-    
-    # Simple ranking algorithm - can be made more sophisticated
-    if current_user.contribution_count % 10 == 0:
-        await db.users.update_one(
-            {"id": current_user.id},
-            {"$inc": {"contributor_rank": 1}}
-        )
+    await record_contribution(current_user, contribution)
     
     return new_word
 
@@ -323,85 +440,107 @@ async def create_word(word_data: WordCreate, current_user: User = Depends(get_cu
 async def update_word(
     word_id: str, 
     word_data: Dict[str, Any] = Body(...), 
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_user)
 ):
-    # Find the word
-    word = await db.words.find_one({"id": word_id})
-    if not word:
-        raise HTTPException(status_code=404, detail="Word not found")
-    
     # Update the word
+    now = datetime.now(timezone.utc)
     update_data = {
         "last_modified_by": current_user.id,
-        "updated_at": datetime.utcnow()
+        "updated_at": now
     }
     
     for field, value in word_data.items():
         if field in ["word", "meanings"]:
             update_data[field] = value
     
-    await db.words.update_one(
+    # Apply the update and read back the result in one atomic command
+    updated_word = await db.words.find_one_and_update(
         {"id": word_id},
-        {"$set": update_data}
+        {"$set": update_data},
+        return_document=ReturnDocument.AFTER
     )
+    if updated_word is None:
+        raise HTTPException(status_code=404, detail="Word not found")
     
     # Record contribution
     contribution = Contribution(
+        id=str(uuid.uuid4()),
         user_id=current_user.id,
         word_id=word_id,
         contribution_type="edit",
-        change_details=word_data
+        change_details=word_data,
+        created_at=now
     )
-    await db.contributions.insert_one(contribution.dict())
+    await record_contribution(current_user, contribution)
     
-    # Update user contribution count and rank
-    await db.users.update_one(
-        {"id": current_user.id},
-        {"$inc": {"contribution_count": 1}}
-    )
-    
-    # Simple ranking algorithm - can be made more sophisticated
-    if current_user.contribution_count % 10 == 0:
-        await db.users.update_one(
-            {"id": current_user.id},
-            {"$inc": {"contributor_rank": 1}}
-        )
-    
-    # Return updated word
-    updated_word = await db.words.find_one({"id": word_id})
     return Word(**updated_word)
 
-@api_router.get("/search", response_model=List[Word])
-async def search_words(word: str, from_language: Optional[str] = None, to_language: Optional[str] = None):
-    query = {"word": {"$regex": f"^{word}", "$options": "i"}}
+@api_router.get("/search")
+async def search_words(
+    word: str,
+    from_language: Optional[str] = None,
+    to_language: Optional[str] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE)
+):
+    # Escaped, anchored prefix match; pymongo encodes the compiled pattern as a BSON
+    # regex with its flags. Escaping keeps user input from injecting regex syntax
+    query = {"word": re.compile(f"^{re.escape(word)}", re.IGNORECASE)}
     
     if from_language:
         query["language_id"] = from_language
     
-    words = await db.words.find(query).to_list(100)
-    result = [Word(**w) for w in words]
-    
-    # Filter for translations to specific language if requested
-    if to_language and result:
-        filtered_results = []
-        for word in result:
-            filtered_meanings = [m for m in word.meanings if m.get("language_id") == to_language]
-            if filtered_meanings:
-                word_copy = word.dict()
-                word_copy["meanings"] = filtered_meanings
-                filtered_results.append(Word(**word_copy))
-        return filtered_results
+    # Filter for translations to specific language if requested, letting the server
+    # drop non-matching words and trim the meanings array
+    projection = {"_id": 0}
+    if to_language:
+        query["meanings"] = {"$elemMatch": {"language_id": to_language}}
+        projection = {
+            "_id": 0,
+            "id": 1,
+            "word": 1,
+            "language_id": 1,
+            "meanings": {
+                "$filter": {
+                    "input": "$meanings",
+                    "as": "meaning",
+                    "cond": {"$eq": ["$$meaning.language_id", to_language]}
+                }
+            },
+            "created_by": 1,
+            "last_modified_by": 1,
+            "created_at": 1,
+            "updated_at": 1
+        }
     
-    return result
-
-@api_router.get("/user/{user_id}/contributions", response_model=List[Contribution])
-async def get_user_contributions(user_id: str, current_user: User = Depends(get_current_active_user)):
+    cursor = (
+        db.words.find(query, projection)
+        .sort([("word", 1), ("_id", 1)])
+        .skip(skip)
+        .limit(limit)
+        .batch_size(CURSOR_BATCH_SIZE)
+    )
+    return [w async for w in cursor]
+
+@api_router.get("/user/{user_id}/contributions")
+async def get_user_contributions(
+    user_id: str,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    current_user: User = Depends(get_current_user)
+):
     # Users can see their own contributions, moderators can see anyone's
     if current_user.id != user_id and current_user.role not in [UserRole.MODERATOR, UserRole.ADMIN]:
         raise HTTPException(status_code=403, detail="Not authorized to view these contributions")
     
-    contributions = await db.contributions.find({"user_id": user_id}).to_list(1000)
-    return [Contribution(**contribution) for contribution in contributions]
+    cursor = (
+        db.contributions.find({"user_id": user_id}, {"_id": 0})
+        .sort([("created_at", 1), ("id", 1)])
+        .skip(skip)
+        .limit(limit)
+        .batch_size(CURSOR_BATCH_SIZE)
+    )
+    return [contribution async for contribution in cursor]
 
 # Include the router in the main app
 app.include_router(api_router)
@@ -424,6 +563,20 @@ logger = logging.getLogger(__name__)
 # Initialize with some common languages
 @app.on_event("startup")
 async def startup_db_client():
+    # Indexes backing uniqueness constraints and the hot lookup paths
+    await db.users.create_index("username", unique=True)
+    await db.users.create_index("email", unique=True)
+    await db.words.create_index("id", unique=True)
+    await db.words.create_index([("language_id", 1), ("word", 1)])
+    # Words span many languages, so the text index must not apply English stemming or stop words
+    try:
+        await db.words.create_index([("word", "text")], default_language="none")
+    except OperationFailure:
+        # Replace a text index created earlier with the default English options
+        await db.words.drop_index("word_text")
+        await db.words.create_index([("word", "text")], default_language="none")
+    await db.contributions.create_index([("user_id", 1), ("created_at", 1), ("id", 1)])
+    
     # Check if languages collection is empty
     count = await db.languages.count_documents({})
     if count == 0:
@@ -440,22 +593,40 @@ async def startup_db_client():
             {"id": str(uuid.uuid4()), "name": "Hindi", "code": "hi", "native_name": "हिन्दी"},
             {"id": str(uuid.uuid4()), "name": "Portuguese", "code": "pt", "native_name": "Português"}
         ]
+        # Stamp the seed documents so they match the Language schema returned by /api/languages
+        now = datetime.now(timezone.utc)
+        for language in common_languages:
+            language["created_at"] = now
+            language["updated_at"] = now
+        
         # Insert languages
-        await db.languages.insert_many(common_languages)
+        await db.languages.insert_many(common_languages, ordered=False)
         
-        # Create a default admin user if it doesn't exist
-        admin_exists = await db.users.find_one({"username": "admin"})
+        # Create a default admin user if it doesn't exist. The cheap probe skips the bcrypt hash
+        # when admin is already there; the upsert stays idempotent if workers race past it
+        admin_exists = await db.users.find_one({"username": "admin"}, {"_id": 1})
         if not admin_exists:
             admin_user = User(
                 email="admin@example.com",
                 username="admin",
-                hashed_password=get_password_hash("admin123"),  # This should be changed in production
+                hashed_password=await get_password_hash("admin123"),  # This should be changed in production
                 role=UserRole.ADMIN
             )
-            await db.users.insert_one(admin_user.dict())
+            await db.users.update_one(
+                {"username": "admin"},
+                {"$setOnInsert": admin_user.model_dump(exclude={"username"})},
+                upsert=True
+            )
             
         logger.info("Initialized database with common languages and admin user")
+    else:
+        # Backfill languages seeded before timestamps were stored
+        await db.languages.update_many(
+            {"created_at": {"$exists": False}},
+            [{"$set": {"created_at": "$$NOW", "updated_at": "$$NOW"}}]
+        )
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
     client.close()
+    password_executor.shutdown(wait=False)